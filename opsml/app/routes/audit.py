@@ -7,6 +7,7 @@
 import codecs
 import csv
 import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, BinaryIO, Dict, List, Optional, cast
 
@@ -37,6 +38,7 @@ TEMPLATE_PATH = Path(__file__).parents[1] / "templates"
 templates = Jinja2Templates(directory=TEMPLATE_PATH)
 
 AUDIT_FILE = "audit_file.csv"
+_AUDIT_ROW = itemgetter("topic", "number", "response")
 
 templates = Jinja2Templates(directory=TEMPLATE_PATH)
 
@@ -228,10 +230,8 @@ class AuditFormUploader:
         """Uploads audit data from file to AuditCard"""
         audit_sections = AuditSections().model_dump()  # type:ignore
         records = self.read_file()
-        for record in records:
-            section = record["topic"]
-            number = int(record["number"])
-            audit_sections[section][number]["response"] = record["response"]
+        for section, number, response in map(_AUDIT_ROW, records):
+            audit_sections[section][int(number)]["response"] = response
         return audit_sections
 
 
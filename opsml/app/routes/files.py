@@ -3,6 +3,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import io
+import json
 import tempfile
 import zipfile as zp
 from pathlib import Path
@@ -223,6 +224,38 @@ def list_files(request: Request, path: str) -> ListFileResponse:
         ) from error
 
 
+@router.get("/files/list/stream", name="stream_list_files")
+def stream_list_files(request: Request, path: str) -> StreamingResponse:
+    """Lists files as a stream of newline-delimited json paths
+
+    Args:
+        request:
+            request object
+        path:
+            path to read
+
+    Returns:
+        Streaming response of file paths
+    """
+
+    swapped_path = swap_opsml_root(request, Path(path))
+    storage_client: StorageClientBase = request.app.state.storage_client
+
+    try:
+        files = storage_client.find(Path(swapped_path))
+
+    except Exception as error:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"There was an error listing files. {error}",
+        ) from error
+
+    return StreamingResponse(
+        (f"{json.dumps(str(reverse_swap_opsml_root(request, Path(file_))))}\n" for file_ in files),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get("/files/exists", name="file_exists")
 def file_exists(request: Request, path: str) -> FileExistsResponse:
     """Checks if path exists
@@ -9,9 +9,11 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from opsml.app.routes.pydantic_models import ProjectIdResponse
 from opsml.app.routes.route_helpers import ProjectRouteHelper
 from opsml.app.routes.utils import error_to_500
 from opsml.helpers.logging import ArtifactLogger
+from opsml.registry import CardRegistry
 
 logger = ArtifactLogger.get_logger()
 
@@ -64,3 +66,39 @@ async def project_metric_page(
     """
 
     return project_route_helper.get_run_metrics(request=request, run_uid=run_uid)  # type: ignore[return-value]
+
+
+@router.get("/projects/id", response_model=ProjectIdResponse, name="project_id")
+def project_id(request: Request, project_name: str) -> ProjectIdResponse:
+    """Get the project_id for a project name
+
+    Args:
+        request:
+            FastAPI request object
+        project_name:
+            Name of the project
+
+    Returns:
+        `ProjectIdResponse`. project_id is None if the project does not exist
+    """
+    registry: CardRegistry = request.app.state.registries.project
+    project_id_ = registry._registry.get_project_id(project_name)  # pylint: disable=protected-access
+
+    return ProjectIdResponse(project_id=project_id_)
+
+
+@router.get("/projects/id/max", response_model=ProjectIdResponse, name="max_project_id")
+def max_project_id(request: Request) -> ProjectIdResponse:
+    """Get the highest project_id in the project registry
+
+    Args:
+        request:
+            FastAPI request object
+
+    Returns:
+        `ProjectIdResponse`
+    """
+    registry: CardRegistry = request.app.state.registries.project
+    project_id_ = registry._registry.get_max_project_id()  # pylint: disable=protected-access
+
+    return ProjectIdResponse(project_id=project_id_)
@@ -177,6 +177,10 @@ class RepositoriesResponse(BaseModel):
     repositories: List[str] = []
 
 
+class ProjectIdResponse(BaseModel):
+    project_id: Optional[int] = None
+
+
 class TableNameResponse(BaseModel):
     table_name: str
 
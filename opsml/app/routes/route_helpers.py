@@ -465,7 +465,7 @@ class ModelRouteHelper(RouteHelper):
             modelcard=cast(ModelCard, modelcard),
         )
 
-        metadata_json = json.dumps(metadata.model_dump(), indent=4)
+        metadata_json = metadata.model_dump_json(indent=4)
 
         model_filename = Path(metadata.model_uri)
 
@@ -8,6 +8,7 @@ import os
 import re
 import traceback
 from functools import wraps
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
@@ -48,13 +49,7 @@ def get_model_versions(registry: CardRegistry, model: str, repository: str) -> L
         A list of model versions
     """
 
-    return [
-        card["version"]
-        for card in registry.list_cards(
-            name=model,
-            repository=repository,
-        )
-    ]
+    return list(map(itemgetter("version"), registry.list_cards(name=model, repository=repository)))
 
 
 def get_names_repositories_versions(
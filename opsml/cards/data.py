@@ -8,11 +8,13 @@
 from typing import (  # noqa # pylint: disable=unused-import
     Any,
     Dict,
+    Iterator,
     List,
     Optional,
     Union,
 )
 
+import pyarrow as pa
 from pydantic import SerializeAsAny
 
 from opsml.cards.base import ArtifactCard
@@ -94,6 +96,22 @@ class DataCard(ArtifactCard):
 
         DataCardLoader(self).load_data(**kwargs)
 
+    def iter_batches(self, batch_size: int = 65_536) -> Iterator[pa.RecordBatch]:
+        """
+        Streams saved data as pyarrow RecordBatches without loading it into the interface.
+        Only supported for interfaces that save data as parquet (ArrowData, PandasData and PolarsData)
+
+        Args:
+            batch_size:
+                Maximum number of rows per batch. Defaults to 65,536
+
+        Yields:
+            pyarrow RecordBatch
+        """
+        from opsml.storage.card_loader import DataCardLoader
+
+        yield from DataCardLoader(self).iter_batches(batch_size=batch_size)
+
     def load_data_profile(self) -> None:
         """
         Load data to interface
@@ -109,8 +127,12 @@ class DataCard(ArtifactCard):
             Returns:
             Registry metadata
         """
-        exclude_attr = {"data"}
-        return self.model_dump(exclude=exclude_attr)
+        # only dump fields used by DataRegistryRecord (skips interface and feature maps)
+        include_attr = {
+            **dict.fromkeys(["name", "repository", "contact", "uid", "version", "tags"], True),
+            "metadata": {"data_type", "runcard_uid", "pipelinecard_uid", "auditcard_uid"},
+        }
+        return self.model_dump(include=include_attr)
 
     def add_info(self, info: Dict[str, Union[float, int, str]]) -> None:
         """
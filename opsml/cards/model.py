@@ -97,8 +97,18 @@ class ModelCard(ArtifactCard):
     def create_registry_record(self) -> Dict[str, Any]:
         """Creates a registry record from the current ModelCard"""
 
-        exclude_vars = {"interface": {"model", "preprocessor", "sample_data", "onnx_model"}}
-        dumped_model = self.model_dump(exclude=exclude_vars)
+        # only dump fields used by ModelRegistryRecord (skips model artifacts and feature schemas)
+        include_vars = {
+            **dict.fromkeys(["name", "repository", "contact", "uid", "version", "tags", "datacard_uid"], True),
+            "interface": {"model_type"},
+            "metadata": {
+                "data_schema": {"data_type"},
+                "runcard_uid": True,
+                "pipelinecard_uid": True,
+                "auditcard_uid": True,
+            },
+        }
+        dumped_model = self.model_dump(include=include_vars)
 
         return dumped_model
 
@@ -51,7 +51,7 @@ class ArrowData(DataInterface):
         """Load parquet dataset to pandas dataframe"""
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path, memory_map=True).read()
 
         self.data = pa_table
 
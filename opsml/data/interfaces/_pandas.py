@@ -9,6 +9,9 @@ from opsml.data.formatter import check_data_schema
 from opsml.data.interfaces._base import DataInterface
 from opsml.types import AllowedDataType, Feature, Suffix
 
+# rows converted to arrow per write (matches pyarrow's default parquet row group size)
+WRITE_BATCH_ROWS = 1024 * 1024
+
 
 class PandasData(DataInterface):
     """Pandas interface
@@ -36,7 +39,6 @@ class PandasData(DataInterface):
         """Saves pandas dataframe to parquet"""
 
         assert self.data is not None, "No data detected in interface"
-        arrow_table = pa.Table.from_pandas(self.data, preserve_index=False)
         self.feature_map = {
             key: Feature(
                 feature_type=str(value),
@@ -44,12 +46,18 @@ class PandasData(DataInterface):
             )
             for key, value in self.data.dtypes.to_dict().items()
         }
-        pq.write_table(arrow_table, path)
+
+        # convert and write in row batches so only one batch is held as arrow at a time
+        schema = pa.Schema.from_pandas(self.data, preserve_index=False)
+        with pq.ParquetWriter(path, schema) as writer:
+            for start in range(0, len(self.data), WRITE_BATCH_ROWS):
+                batch = self.data.iloc[start : start + WRITE_BATCH_ROWS]
+                writer.write_table(pa.Table.from_pandas(batch, schema=schema, preserve_index=False))
 
     def load_data(self, path: Path) -> None:
         """Load parquet dataset to pandas dataframe"""
 
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=path).read()
+        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=path, memory_map=True).read()
 
         data = check_data_schema(
             pa_table.to_pandas(),
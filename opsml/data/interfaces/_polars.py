@@ -50,7 +50,7 @@ class PolarsData(DataInterface):
         """Load parquet dataset to pandas dataframe"""
 
         load_path = path.with_suffix(self.data_suffix)
-        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path).read()
+        pa_table: pa.Table = pq.ParquetDataset(path_or_paths=load_path, memory_map=True).read()
         data = check_data_schema(
             pl.from_arrow(data=pa_table),
             self.feature_map,
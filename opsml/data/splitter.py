@@ -5,6 +5,7 @@
 from dataclasses import dataclass
 from typing import Any, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
@@ -37,7 +38,8 @@ class DataSplit(BaseModel):
         """Pre to convert indices to list if not None"""
 
         if value is not None and not isinstance(value, list):
-            value = list(value)
+            # tolist converts in C to python ints instead of boxing numpy scalars one at a time
+            value = value.tolist() if isinstance(value, np.ndarray) else list(value)
 
         return value
 
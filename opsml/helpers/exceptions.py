@@ -7,3 +7,7 @@ class MoreThanOnePathException(Exception):
 
 class VersionError(ValueError):
     """Invalid version"""
+
+
+class RouteNotFoundError(ValueError):
+    """Server does not expose the requested route (e.g. an older server version)"""
@@ -96,7 +96,7 @@ class ModelLoader:
         metadata_path = (self.path / SaveName.MODEL_METADATA.value).with_suffix(Suffix.JSON.value)
 
         with metadata_path.open("r") as file_:
-            return ModelMetadata(**json.load(file_))
+            return ModelMetadata.model_validate(json.load(file_))
 
     def _load_huggingface_preprocessors(self) -> None:
         """Load huggingface preprocessors from disk"""
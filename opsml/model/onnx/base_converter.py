@@ -89,7 +89,7 @@ class _ModelConverter:
             Encrypted model definition
         """
 
-        if self.model_class in [*SKLEARN_SUPPORTED_MODEL_TYPES, *LIGHTGBM_SUPPORTED_MODEL_TYPES]:
+        if self.model_class in SKLEARN_SUPPORTED_MODEL_TYPES | LIGHTGBM_SUPPORTED_MODEL_TYPES:
             OpsmlImportExceptions.try_skl2onnx_imports()
         elif self.model_class == TrainedModelType.TF_KERAS:
             OpsmlImportExceptions.try_tf2onnx_imports()
@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional, Tuple, cast
 from opsml.model.interfaces.base import ModelInterface
 from opsml.model.utils.data_helper import FloatTypeConverter, ModelDataHelper
 from opsml.types import (
-    AVAILABLE_MODEL_TYPES,
+    AVAILABLE_MODEL_TYPE_VALUES,
     AllowedDataType,
     Feature,
     OnnxModel,
@@ -25,6 +25,15 @@ except ModuleNotFoundError:
 
 ModelConvertOutput = Tuple[OnnxModel, Dict[str, Feature], Optional[Dict[str, Feature]]]
 
+# model classes that take numpy input but are not converted through the sklearn path
+NON_SKLEARN_NUMPY_MODELS = frozenset(
+    {
+        TrainedModelType.TF_KERAS,
+        TrainedModelType.PYTORCH,
+        TrainedModelType.TRANSFORMERS,
+    }
+)
+
 
 # lgb and xgb need to be converted to float32
 # sklearn pipeline needs to be converted to float32 (some features)
@@ -90,11 +99,7 @@ class NumpyOnnxConverter(DataConverter):
     @staticmethod
     def validate(data_type: str, model_type: str, model_class: str) -> bool:
         if data_type == AllowedDataType.NUMPY:
-            if model_class in AVAILABLE_MODEL_TYPES and model_class not in [
-                TrainedModelType.TF_KERAS,
-                TrainedModelType.PYTORCH,
-                TrainedModelType.TRANSFORMERS,
-            ]:
+            if model_class in AVAILABLE_MODEL_TYPE_VALUES and model_class not in NON_SKLEARN_NUMPY_MODELS:
                 return True
         return False
 
@@ -19,8 +19,8 @@ from opsml.types import (
     SKLEARN_SUPPORTED_MODEL_TYPES,
     UPDATE_REGISTRY_MODELS,
     BaseEstimator,
-    ModelType,
     TrainedModelType,
+    resolve_model_type,
 )
 
 logger = ArtifactLogger.get_logger()
@@ -78,14 +78,7 @@ class _SklearnOnnxModel(_ModelConverter):
         if estimator is None:
             estimator = self.trained_model.estimator
 
-        model_type = next(
-            (
-                model_type
-                for model_type in ModelType.__subclasses__()
-                if model_type.validate(model_class_name=estimator.__class__.__name__)
-            )
-        )
-        estimator_type = model_type.get_type()
+        estimator_type = resolve_model_type(estimator.__class__.__name__)
 
         if estimator_type in UPDATE_REGISTRY_MODELS:
             OnnxRegistryUpdater.update_onnx_registry(
@@ -12,6 +12,7 @@ from numpy.typing import NDArray
 from opsml.helpers.logging import ArtifactLogger
 from opsml.helpers.utils import get_class_name
 from opsml.types import (
+    FEATURE_VALIDATOR,
     AllowedDataType,
     CommonKwargs,
     DataDtypes,
@@ -179,7 +180,7 @@ class PandasDataFrameData(ModelDataHelper):
     def feature_dict(self) -> Dict[str, Feature]:
         feature_dict = {}
         for feature, type_ in zip(self.features, self.dtypes):
-            feature_dict[feature] = Feature(feature_type=type_, shape=(1,))
+            feature_dict[feature] = FEATURE_VALIDATOR({"feature_type": type_, "shape": (1,)})
         return feature_dict
 
     @property
@@ -232,7 +233,7 @@ class DataDictionary(ModelDataHelper):
         for feature, type_, shape in zip(self.features, self.dtypes, self.shape):
             if not isinstance(shape, tuple):
                 shape = (shape,)
-            feature_dict[feature] = Feature(feature_type=type_, shape=shape)
+            feature_dict[feature] = FEATURE_VALIDATOR({"feature_type": type_, "shape": shape})
         return feature_dict
 
     @property
@@ -328,7 +329,7 @@ class IterData(ModelDataHelper):
         for feature, type_, shape in zip(self.features, self.dtypes, self.shape):
             if not isinstance(shape, tuple):
                 shape = (shape,)
-            feature_dict[feature] = Feature(feature_type=type_, shape=shape)
+            feature_dict[feature] = FEATURE_VALIDATOR({"feature_type": type_, "shape": shape})
         return feature_dict
 
     @property
@@ -11,7 +11,7 @@ from opsml.helpers.logging import ArtifactLogger
 from opsml.projects.active_run import ActiveRun, RunInfo
 from opsml.projects.types import ProjectInfo, Tags
 from opsml.registry import CardRegistries
-from opsml.types import CommonKwargs
+from opsml.types import CommonKwargs, RegistryType
 
 logger = ArtifactLogger.get_logger()
 
@@ -39,7 +39,7 @@ class _RunManager:
         if run_id is not None:
             self._verify_run_id(run_id)
             self.run_id = run_id
-            self._run_exists = self._card_exists(run_id=self.run_id)
+            self._run_exists = True  # _verify_run_id raises if the run does not exist
 
         else:
             self.run_id = None
@@ -64,20 +64,10 @@ class _RunManager:
             Tags.ID.value: self.project_id,
         }
 
-    def _card_exists(self, run_id: str) -> bool:
-        """Verifies the run exists for the given project."""
-        assert self.run_id is not None, "run_id should not be None"
-        card = self.registries.run._registry.list_cards(uid=run_id)
-        if card:
-            return True
-        return False
-
     def _verify_run_id(self, run_id: str) -> None:
         """Verifies the run exists for the given project."""
 
-        card = self.registries.run._registry.list_cards(uid=run_id)
-
-        if not card:
+        if not self.registries.run._registry.check_uid(uid=run_id, registry_type=RegistryType.RUN):
             raise ValueError("Invalid run_id")
 
     def _create_active_opsml_run(self, run_name: Optional[str]) -> ActiveRun:
@@ -171,23 +161,17 @@ class _RunManager:
 
         """
 
-        projects = self.registries.project.list_cards(name=self._project_info.name)
-        if bool(projects):
-            return int(projects[0]["project_id"])
-
-        # get nbr of unique projects
-        cards = self.registries.project.list_cards()
+        registry = self.registries.project._registry
 
-        if cards:
-            max_project = max(card["project_id"] for card in cards)
-        else:
-            max_project = 0
+        project_id = registry.get_project_id(self._project_info.name)
+        if project_id is not None:
+            return project_id
 
         card = ProjectCard(
             name=self._project_info.name,
             repository=self._project_info.repository,
             contact="",
-            project_id=max_project + 1,
+            project_id=registry.get_max_project_id() + 1,
         )
         self.registries.project.register_card(card=card)
 
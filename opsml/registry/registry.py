@@ -3,7 +3,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import textwrap
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Mapping, Optional, Type, Union
 
 from opsml.cards import ArtifactCard, CardInfo
 from opsml.data import DataInterface
@@ -63,24 +63,17 @@ class CardRegistry:
         local) which requires sqlalchemy and "client" mode which does not, we
         only want to import ServerRegistry when we know we need it.
         """
-        sql_registry_type: Type[SQLRegistryBase]
+        registries: Mapping[RegistryType, Type[SQLRegistryBase]]
         if config.is_tracking_local:
-            from opsml.registry.sql.base.server import ServerRegistry
+            from opsml.registry.sql.base.server import SERVER_REGISTRIES
 
-            sql_registry_type = ServerRegistry
+            registries = SERVER_REGISTRIES
         else:
-            from opsml.registry.sql.base.client import ClientRegistry
+            from opsml.registry.sql.base.client import CLIENT_REGISTRIES
 
-            sql_registry_type = ClientRegistry
+            registries = CLIENT_REGISTRIES
 
-        registry = next(
-            registry
-            for registry in sql_registry_type.__subclasses__()
-            if registry.validate(
-                registry_name=registry_type.value,
-            )
-        )
-        return registry(
+        return registries[registry_type](
             registry_type=registry_type,
             storage_client=client.storage_client,
         )
@@ -256,6 +249,45 @@ class CardRegistry:
                 build_tag=build_tag,
             )
 
+    def register_cards(
+        self,
+        cards: List[ArtifactCard],
+        version_type: VersionType = VersionType.MINOR,
+        pre_tag: str = "rc",
+        build_tag: str = "build",
+    ) -> None:
+        """
+        Adds new `Card` records to registry in a single insert. Registration will be skipped for cards
+        that already exist. Batches are only supported when connected directly to the registry database;
+        in client mode, register each card with `register_card`.
+
+        Args:
+            cards:
+                cards to register. Each card must have a unique name
+            version_type:
+                Version type for increment. Options are "major", "minor" and
+                "patch". Defaults to "minor".
+            pre_tag:
+                pre-release tag to add to card versions
+            build_tag:
+                build tag to add to card versions
+        """
+
+        new_cards = []
+        for card in cards:
+            if card.uid is not None and card.version is not None:
+                logger.info("Card {} already exists. Skipping registration.", card.uid)
+            else:
+                new_cards.append(card)
+
+        if new_cards:
+            self._registry.register_cards(
+                cards=new_cards,
+                version_type=version_type,
+                pre_tag=pre_tag,
+                build_tag=build_tag,
+            )
+
     def update_card(self, card: ArtifactCard) -> None:
         """
         Update an artifact card based on current registry
@@ -3,6 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Any, List, Optional
 
 import semver
@@ -14,6 +15,12 @@ from opsml.helpers.logging import ArtifactLogger
 logger = ArtifactLogger.get_logger()
 
 
+@lru_cache(maxsize=1024)
+def _parse_semver(version: str) -> semver.VersionInfo:
+    """Parses and caches a version string. VersionInfo is immutable, so cached results are safe to share"""
+    return semver.VersionInfo.parse(version)
+
+
 class VersionType(str, Enum):
     MAJOR = "major"
     MINOR = "minor"
@@ -93,7 +100,7 @@ class CardVersion(BaseModel):
     @property
     def valid_version(self) -> str:
         if self.is_full_semver:
-            return str(semver.VersionInfo.parse(self.version).finalize_version())
+            return str(_parse_semver(self.version).finalize_version())
         return self.version
 
     @staticmethod
@@ -144,7 +151,7 @@ class SemVerUtils:
 
     @staticmethod
     def sort_semvers(versions: List[str]) -> List[str]:
-        """Implements bubble sort for semvers
+        """Sorts semvers using semver comparison logic
 
         Args:
             versions:
@@ -153,33 +160,14 @@ class SemVerUtils:
         Returns:
             sorted list of versions with highest version first
         """
-
-        n_ver = len(versions)
-
-        for i in range(n_ver):
-            already_sorted = True
-
-            for j in range(n_ver - i - 1):
-                j_version = semver.VersionInfo.parse(versions[j])
-                j1_version = semver.VersionInfo.parse(versions[j + 1])
-
-                # use semver comparison logic
-                if j_version > j1_version:
-                    # swap
-                    versions[j], versions[j + 1] = versions[j + 1], versions[j]
-
-                    already_sorted = False
-
-            if already_sorted:
-                break
-
+        versions.sort(key=_parse_semver)
         versions.reverse()
         return versions
 
     @staticmethod
     def is_release_candidate(version: str) -> bool:
         """Ignores pre-release versions"""
-        ver = semver.VersionInfo.parse(version)
+        ver = _parse_semver(version)
         return bool(ver.prerelease)
 
     @staticmethod
@@ -209,7 +197,7 @@ class SemVerUtils:
         Returns:
             New version
         """
-        ver: semver.VersionInfo = semver.VersionInfo.parse(version)
+        ver: semver.VersionInfo = _parse_semver(version)
 
         # Set major, minor, patch
         if version_type == VersionType.MAJOR:
@@ -303,7 +291,7 @@ class SemVerRegistryValidator:
             str: version to use
         """
         version = versions[0]
-        recent_ver = semver.VersionInfo.parse(version)
+        recent_ver = _parse_semver(version)
         # first need to check if increment is mmp
         if self.version_type in [VersionType.MAJOR, VersionType.MINOR, VersionType.PATCH]:
             # check if most recent version is a pre-release or build
@@ -313,7 +301,7 @@ class SemVerRegistryValidator:
                     # if all versions are pre-release use finalized version
                     # if not, increment version
                     for ver in versions:
-                        parsed_ver = semver.VersionInfo.parse(ver)
+                        parsed_ver = _parse_semver(ver)
                         if parsed_ver.prerelease is None:
                             raise VersionError("Major, minor and patch version combination already exists")
                     return version
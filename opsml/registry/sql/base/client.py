@@ -2,12 +2,14 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 import textwrap
+import threading
+import time
+from collections import OrderedDict
 from functools import cached_property
-from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
-
-import pandas as pd
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, cast
 
 from opsml.cards import ArtifactCard, ModelCard
+from opsml.helpers.exceptions import RouteNotFoundError
 from opsml.helpers.logging import ArtifactLogger
 from opsml.helpers.utils import check_package_exists
 from opsml.registry.semver import CardVersion, VersionType
@@ -19,6 +21,34 @@ from opsml.types import RegistryType
 
 logger = ArtifactLogger.get_logger()
 
+# (server base url, registry_type, uid) -> time the uid was last confirmed to exist. Only positive
+# lookups are cached since a missing uid can be registered at any time. Keys are ordered oldest first.
+UidKey = Tuple[str, str, str]
+_KNOWN_UIDS: "OrderedDict[UidKey, float]" = OrderedDict()
+_KNOWN_UID_TTL = 30.0
+_KNOWN_UID_MAXSIZE = 4096
+_KNOWN_UIDS_LOCK = threading.Lock()
+
+
+def _is_known_uid(key: UidKey) -> bool:
+    with _KNOWN_UIDS_LOCK:
+        checked_at = _KNOWN_UIDS.get(key)
+        return checked_at is not None and time.monotonic() - checked_at < _KNOWN_UID_TTL
+
+
+def _remember_uid(key: UidKey) -> None:
+    with _KNOWN_UIDS_LOCK:
+        _KNOWN_UIDS[key] = time.monotonic()
+        _KNOWN_UIDS.move_to_end(key)
+
+        while len(_KNOWN_UIDS) > _KNOWN_UID_MAXSIZE:
+            _KNOWN_UIDS.popitem(last=False)
+
+
+def _forget_uid(key: UidKey) -> None:
+    with _KNOWN_UIDS_LOCK:
+        _KNOWN_UIDS.pop(key, None)
+
 
 class ClientRegistry(SQLRegistryBase):
     """A registry that retrieves data from an opsml server instance."""
@@ -46,10 +76,6 @@ class ClientRegistry(SQLRegistryBase):
         """Registry type"""
         raise NotImplementedError
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        raise NotImplementedError
-
     @property
     def unique_repositories(self) -> Sequence[str]:
         """Returns a list of unique repositories"""
@@ -80,13 +106,27 @@ class ClientRegistry(SQLRegistryBase):
 
         return cast(List[str], data["names"])
 
+    def _uid_key(self, uid: str, registry_type: RegistryType) -> UidKey:
+        """Uid cache key, scoped to the server this client talks to"""
+        return (self._session.base_url, registry_type.value, uid)
+
     def check_uid(self, uid: str, registry_type: RegistryType) -> bool:
+        key = self._uid_key(uid=uid, registry_type=registry_type)
+        if _is_known_uid(key):
+            return True
+
         data = self._session.post_request(
             route=api_routes.CHECK_UID,
             json={"uid": uid, "registry_type": registry_type.value},
         )
 
-        return bool(data.get("uid_exists"))
+        exists = bool(data.get("uid_exists"))
+        if exists:
+            _remember_uid(key)
+        else:
+            _forget_uid(key)
+
+        return exists
 
     def set_version(
         self,
@@ -128,7 +168,7 @@ class ClientRegistry(SQLRegistryBase):
         limit: Optional[int] = None,
         ignore_release_candidates: bool = False,
         query_terms: Optional[Dict[str, Any]] = None,
-    ) -> pd.DataFrame:
+    ) -> List[Dict[str, Any]]:
         """
         Retrieves records from registry
 
@@ -171,7 +211,7 @@ class ClientRegistry(SQLRegistryBase):
             },
         )
 
-        return data["cards"]
+        return cast(List[Dict[str, Any]], data["cards"])
 
     @log_card_change
     def add_and_commit(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
@@ -184,9 +224,20 @@ class ClientRegistry(SQLRegistryBase):
         )
 
         if bool(data.get("registered")):
+            _remember_uid(self._uid_key(uid=str(card["uid"]), registry_type=self.registry_type))
             return card, "registered"
         raise ValueError("Failed to register card")
 
+    def register_cards(
+        self,
+        cards: List[ArtifactCard],
+        version_type: VersionType = VersionType.MINOR,
+        pre_tag: str = "rc",
+        build_tag: str = "build",
+    ) -> None:
+        # the server api registers one card per request, so a batch could only be partially registered
+        raise ValueError("register_cards is not supported in client mode. Register each card with register_card")
+
     @log_card_change
     def update_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         data = self._session.post_request(
@@ -211,6 +262,8 @@ class ClientRegistry(SQLRegistryBase):
             },
         )
 
+        _forget_uid(self._uid_key(uid=str(card.get("uid")), registry_type=self.registry_type))
+
         if bool(data.get("deleted")):
             return card, "deleted"
         raise ValueError("Failed to delete card")
@@ -221,10 +274,6 @@ class ClientDataCardRegistry(ClientRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.DATA
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.DATA.value
-
 
 class ClientModelCardRegistry(ClientRegistry):
     @property
@@ -273,22 +322,6 @@ class ClientModelCardRegistry(ClientRegistry):
             )
 
         else:
-            model_card = cast(ModelCard, card)
-
-            if model_card.to_onnx:
-                if not check_package_exists("onnx"):
-                    raise ModuleNotFoundError(
-                        """To convert a model to onnx, please install onnx via one of the extras
-                        (opsml[sklearn_onnx], opsml[tf_onnx], opsml[torch_onnx]) or set to_onnx to False.
-                        """
-                    )
-
-            if not self._has_datacard_uid(uid=model_card.datacard_uid):
-                raise ValueError("""ModelCard must be associated with a valid DataCard uid""")
-
-            if model_card.datacard_uid is not None:
-                self._validate_datacard_uid(uid=model_card.datacard_uid)
-
             super().register_card(
                 card=card,
                 version_type=version_type,
@@ -296,9 +329,35 @@ class ClientModelCardRegistry(ClientRegistry):
                 build_tag=build_tag,
             )
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.MODEL.value
+    def _validate_and_version_card(
+        self,
+        card: ArtifactCard,
+        version_type: VersionType,
+        pre_tag: str,
+        build_tag: str,
+    ) -> None:
+        model_card = cast(ModelCard, card)
+
+        if model_card.to_onnx:
+            if not check_package_exists("onnx"):
+                raise ModuleNotFoundError(
+                    """To convert a model to onnx, please install onnx via one of the extras
+                    (opsml[sklearn_onnx], opsml[tf_onnx], opsml[torch_onnx]) or set to_onnx to False.
+                    """
+                )
+
+        if not self._has_datacard_uid(uid=model_card.datacard_uid):
+            raise ValueError("""ModelCard must be associated with a valid DataCard uid""")
+
+        if model_card.datacard_uid is not None:
+            self._validate_datacard_uid(uid=model_card.datacard_uid)
+
+        super()._validate_and_version_card(
+            card=card,
+            version_type=version_type,
+            pre_tag=pre_tag,
+            build_tag=build_tag,
+        )
 
 
 class ClientRunCardRegistry(ClientRegistry):
@@ -306,20 +365,12 @@ class ClientRunCardRegistry(ClientRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.RUN
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.RUN.value
-
 
 class ClientPipelineCardRegistry(ClientRegistry):
     @property
     def registry_type(self) -> RegistryType:
         return RegistryType.PIPELINE
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.PIPELINE.value
-
     def delete_card(self, card: ArtifactCard) -> None:
         raise ValueError("PipelineCardRegistry does not support delete_card")
 
@@ -329,13 +380,41 @@ class ClientProjectCardRegistry(ClientRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.PROJECT
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.PROJECT.value
-
     def delete_card(self, card: ArtifactCard) -> None:
         raise ValueError("ProjectCardRegistry does not support delete_card")
 
+    def get_project_id(self, project_name: str) -> Optional[int]:
+        """Returns the project_id for a given project name
+
+        Args:
+            project_name:
+                Name of the project
+
+        Returns:
+            project_id or None if the project does not exist
+        """
+        try:
+            data = self._session.get_request(
+                route=api_routes.PROJECT_ID,
+                params={"project_name": project_name},
+            )
+        except RouteNotFoundError:
+            # older servers do not have the project id routes
+            projects = self.list_cards(name=project_name)
+            return int(projects[0]["project_id"]) if projects else None
+
+        return cast(Optional[int], data.get("project_id"))
+
+    def get_max_project_id(self) -> int:
+        """Returns the highest project_id in the registry or 0 if there are no projects"""
+        try:
+            data = self._session.get_request(route=api_routes.MAX_PROJECT_ID, params={})
+        except RouteNotFoundError:
+            # older servers do not have the project id routes
+            return max((int(card["project_id"]) for card in self.list_cards()), default=0)
+
+        return int(data["project_id"])
+
 
 class ClientAuditCardRegistry(ClientRegistry):
     @property
@@ -345,6 +424,12 @@ class ClientAuditCardRegistry(ClientRegistry):
     def validate_uid(self, uid: str, registry_type: RegistryType) -> bool:
         return self.check_uid(uid=uid, registry_type=registry_type)
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.AUDIT.value
+
+CLIENT_REGISTRIES: Dict[RegistryType, Type[ClientRegistry]] = {
+    RegistryType.DATA: ClientDataCardRegistry,
+    RegistryType.MODEL: ClientModelCardRegistry,
+    RegistryType.RUN: ClientRunCardRegistry,
+    RegistryType.PIPELINE: ClientPipelineCardRegistry,
+    RegistryType.PROJECT: ClientProjectCardRegistry,
+    RegistryType.AUDIT: ClientAuditCardRegistry,
+}
@@ -3,7 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Set
 
 from alembic import command
 from alembic.config import Config
@@ -18,6 +18,9 @@ logger = ArtifactLogger.get_logger()
 
 DIR_PATH = Path(__file__).parents[1]
 
+# databases that have already been migrated in this process
+_INITIALIZED_DBS: Set[str] = set()
+
 
 class DBInitializer:
     def __init__(self, engine: Engine, registry_tables: List[str]):
@@ -56,8 +59,16 @@ class DBInitializer:
         return config
 
     def initialize(self) -> None:
-        """Create tables if they don't exist and update"""
+        """Create tables if they don't exist and update. Alembic migrations only run once per
+        database and process unless the tables have since been dropped"""
+
+        db_url = str(self.engine.url)
 
         if not self.registry_tables_exist():
             self.create_tables()
+
+        elif db_url in _INITIALIZED_DBS:
+            return
+
         self.update_tables()
+        _INITIALIZED_DBS.add(db_url)
@@ -6,20 +6,24 @@
 import datetime
 from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, cast
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
-from sqlalchemy import Integer
+from sqlalchemy import Integer, bindparam
 from sqlalchemy import cast as sql_cast
 from sqlalchemy import func as sqa_func
-from sqlalchemy import select, text
-from sqlalchemy.engine import Engine, Row
+from sqlalchemy import insert
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select, text, update
+from sqlalchemy.engine import Engine, Row, RowMapping
+from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql import FromClause, Select
 from sqlalchemy.sql.expression import ColumnElement
 
 from opsml.helpers.logging import ArtifactLogger
 from opsml.registry.semver import get_version_to_search
-from opsml.registry.sql.base.sql_schema import CardSQLTable, SQLTableGetter
+from opsml.registry.sql.base.sql_schema import CardSQLTable, SQLTableGetter, normalize_name
 
 logger = ArtifactLogger.get_logger()
 
@@ -134,46 +138,48 @@ class QueryEngine:
     def __init__(self, engine: Engine) -> None:
         self.engine = engine
 
+        # sessions commit once and are closed, so expiring or autoflushing instances only adds reloads
+        self._session_factory = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
     @property
     def dialect(self) -> str:
         return str(self.engine.url)
 
     @contextmanager
     def session(self) -> Iterator[Session]:
-        with Session(self.engine) as sess:
+        with self._session_factory() as sess:
             yield sess
 
-    def _create_version_query(
-        self,
-        table: CardSQLTable,
-        name: str,
-        version: Optional[str] = None,
-    ) -> Select[Any]:
-        """Creates query to get latest card version
+    @staticmethod
+    @lru_cache
+    def _create_version_query(table: CardSQLTable, search_version: bool = False) -> Select[Any]:
+        """Creates query to get latest card versions. Built once per table and filter combination;
+        name and version are bound at execution
 
         Args:
             table:
                 Registry table to query
-            name:
-                Name of the card
-            version:
-                Version of the card
+            search_version:
+                Whether to filter on a version prefix
         Returns:
             Query to get latest card version
         """
-        table_select = select(table).filter(table.name == name)  # type: ignore
+        table_select = select(table.repository, table.version).filter(table.name == bindparam("name"))  # type: ignore
 
-        if version is not None:
-            table_select = table_select.filter(table.version.like(f"{version}%"))  # type: ignore
+        if search_version:
+            table_select = table_select.filter(table.version.like(bindparam("version")))  # type: ignore
 
-        return table_select.order_by(table.timestamp.desc(), table.version.desc()).limit(20)  # type: ignore
+        return cast(
+            Select[Any],
+            table_select.order_by(table.timestamp.desc(), table.version.desc()).limit(20),  # type: ignore
+        )
 
     def get_versions(
         self,
         table: CardSQLTable,
         name: str,
         version: Optional[str] = None,
-    ) -> List[Any]:
+    ) -> Sequence[Row[Any]]:
         """Return all versions of a card
 
         Args:
@@ -185,14 +191,16 @@ class QueryEngine:
                 Version of the card
 
         Returns:
-            List of all versions of a card
+            Repository and version rows for the card
         """
-        query = self._create_version_query(table=table, name=name, version=version)
+        query = self._create_version_query(table=table, search_version=version is not None)
+        params = {"name": name}
 
-        with self.session() as sess:
-            results = sess.scalars(query).all()
+        if version is not None:
+            params["version"] = f"{version}%"
 
-        return cast(List[Any], results)
+        with self.session() as sess:
+            return sess.execute(query, params).all()
 
     def _records_from_table_query(
         self,
@@ -233,11 +241,15 @@ class QueryEngine:
             Sqlalchemy Select statement
         """
 
-        query = cast(Select[Any], select(table))
-        query = DialectHelper.get_dialect_logic(query=query, table=table, dialect=self.dialect)
+        # select mapped columns rather than the entity so rows are not built into ORM objects
+        columns = [getattr(table, key) for key in self._record_keys(table=table)]
+        query = cast(Select[Any], select(*columns))
 
+        # uid is the primary key, so there is at most one row and nothing to sort by version
         if bool(uid):
-            return query.filter(table.uid == uid)  # type: ignore
+            return query.filter(table.uid == uid).limit(1)  # type: ignore
+
+        query = DialectHelper.get_dialect_logic(query=query, table=table, dialect=self.dialect)
 
         filters = []
 
@@ -271,25 +283,29 @@ class QueryEngine:
 
         return query
 
-    def _parse_records(self, records: Sequence[Row[Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    @lru_cache
+    def _record_keys(table: CardSQLTable) -> Tuple[str, ...]:
+        """Mapped attribute names of a registry table (attribute names can differ from column names)"""
+        return tuple(prop.key for prop in sa_inspect(table).column_attrs)
+
+    def _parse_records(self, records: Sequence[RowMapping], table: CardSQLTable) -> List[Dict[str, Any]]:
         """
         Helper for parsing sql results
 
         Args:
             results:
-                Returned object sql query
+                Returned mappings from sql query
+            table:
+                Registry table that was queried
 
         Returns:
             List of dictionaries
         """
-        record_list: List[Dict[str, Any]] = []
+        keys = self._record_keys(table=table)
 
-        for row in records:
-            result_dict = row[0].__dict__
-            result_dict.pop("_sa_instance_state")
-            record_list.append(result_dict)
-
-        return record_list
+        # drops the major, minor and patch sort columns added by the dialect helper
+        return [{key: row[key] for key in keys} for row in records]
 
     def get_records_from_table(
         self,
@@ -316,9 +332,9 @@ class QueryEngine:
         )
 
         with self.session() as sess:
-            results = sess.execute(query).all()
+            results = sess.execute(query).mappings().all()
 
-        return self._parse_records(results)
+        return self._parse_records(results, table=table)
 
     def _get_epoch_time_to_search(self, max_date: str) -> int:
         """
@@ -339,17 +355,38 @@ class QueryEngine:
         # opsml timestamp records are stored as BigInts
         return int(round(max_date_.timestamp() * 1_000_000))
 
-    def _uid_exists_query(self, uid: str, table_to_check: str) -> Select[Any]:
+    @staticmethod
+    @lru_cache
+    def _uid_exists_query(table_to_check: str) -> Select[Any]:
+        """Built once per table. uid is bound at execution"""
         table = SQLTableGetter.get_table(table_name=table_to_check)
-        query = select(table).filter(table.uid == uid)
+        query = select(table.uid).filter(table.uid == bindparam("uid")).limit(1)
 
         return cast(Select[Any], query)
 
-    def get_uid(self, uid: str, table_to_check: str) -> List[str]:
-        query = self._uid_exists_query(uid=uid, table_to_check=table_to_check)
+    def get_uid(self, uid: str, table_to_check: str) -> Optional[str]:
+        query = self._uid_exists_query(table_to_check=table_to_check)
 
         with self.session() as sess:
-            return cast(List[str], sess.execute(query).first())
+            return cast(Optional[str], sess.scalar(query, {"uid": uid}))
+
+    @staticmethod
+    def _normalize_card(card: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalizes name and repository with the rule the BaseMixin validators use,
+        since Core insert and update statements bypass those validators
+
+        Args:
+            card:
+                card record
+
+        Returns:
+            Copy of the card record with normalized name and repository
+        """
+        normalized = dict(card)
+        for key in ("name", "repository"):
+            if normalized.get(key) is not None:
+                normalized[key] = normalize_name(normalized[key])
+        return normalized
 
     def add_and_commit_card(
         self,
@@ -365,10 +402,26 @@ class QueryEngine:
                 card to add
         """
 
-        sql_record = table(**card)  # type:ignore[operator]
+        with self.session() as sess:
+            sess.execute(insert(table), self._normalize_card(card))
+            sess.commit()
+
+    def add_and_commit_cards(
+        self,
+        table: CardSQLTable,
+        cards: List[Dict[str, Any]],
+    ) -> None:
+        """Add card records to table with a single executemany insert
+
+        Args:
+            table:
+                table to add cards to
+            cards:
+                cards to add
+        """
 
         with self.session() as sess:
-            sess.add(sql_record)
+            sess.execute(insert(table), [self._normalize_card(card) for card in cards])
             sess.commit()
 
     def update_card_record(
@@ -376,11 +429,16 @@ class QueryEngine:
         table: CardSQLTable,
         card: Dict[str, Any],
     ) -> None:
-        record_uid = cast(str, card.get("uid"))
+        # bulk update by primary key; nothing is loaded into the session so there is nothing to synchronize
+        query = (
+            update(table)
+            .where(table.uid == card["uid"])
+            .values(self._normalize_card(card))
+            .execution_options(synchronize_session=False)
+        )
 
         with self.session() as sess:
-            query = sess.query(table).filter(table.uid == record_uid)
-            query.update(card)
+            sess.execute(query)
             sess.commit()
 
     def get_unique_repositories(self, table: CardSQLTable) -> Sequence[str]:
@@ -412,6 +470,41 @@ class QueryEngine:
         with self.session() as sess:
             return sess.scalars(query).all()
 
+    def get_project_id(self, project_name: str, table: CardSQLTable) -> Optional[int]:
+        """Returns the project_id for a project name without loading full project records
+
+        Args:
+            project_name:
+                Name of the project
+            table:
+                Project registry table
+
+        Returns:
+            project_id or None if the project does not exist
+        """
+        query = self._project_id_query(table=table)
+
+        with self.session() as sess:
+            return cast(Optional[int], sess.scalar(query, {"project_name": project_name}))
+
+    @staticmethod
+    @lru_cache
+    def _project_id_query(table: CardSQLTable) -> Select[Any]:
+        """Built once per table. project_name is bound at execution"""
+        return cast(Select[Any], select(table.project_id).filter(table.name == bindparam("project_name")).limit(1))
+
+    def get_max_project_id(self, table: CardSQLTable) -> int:
+        """Returns the highest project_id in the project registry or 0 if it is empty
+
+        Args:
+            table:
+                Project registry table
+        """
+        query = select(sqa_func.max(table.project_id))
+
+        with self.session() as sess:
+            return int(sess.scalar(query) or 0)
+
     def delete_card_record(
         self,
         table: CardSQLTable,
@@ -1,7 +1,8 @@
 # Copyright (c) Shipt, Inc.
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
-import uuid
+import os
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from semver import VersionInfo
@@ -45,6 +46,10 @@ class SQLRegistryBase:
     def supported_card(self) -> str:
         return f"{self.table_name.split('_')[1]}Card"
 
+    @cached_property
+    def _supported_card_key(self) -> str:
+        return self.supported_card.lower()
+
     def set_version(
         self,
         name: str,
@@ -58,7 +63,7 @@ class SQLRegistryBase:
 
     def _is_correct_card_type(self, card: ArtifactCard) -> bool:
         """Checks wether the current card is associated with the correct registry type"""
-        return self.supported_card.lower() == card.__class__.__name__.lower()
+        return self._supported_card_key == type(card).__name__.lower()
 
     @property
     def registry_type(self) -> RegistryType:
@@ -67,19 +72,18 @@ class SQLRegistryBase:
 
     def _get_uid(self) -> str:
         """Sets a unique id to be applied to a card"""
-        return uuid.uuid4().hex
+        return os.urandom(16).hex()
 
     def add_and_commit(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         raise NotImplementedError
 
-    def update_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    def add_and_commit_many(self, cards: List[Dict[str, Any]]) -> None:
         raise NotImplementedError
 
-    def delete_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    def update_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         raise NotImplementedError
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
+    def delete_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         raise NotImplementedError
 
     def _validate_card_type(self, card: ArtifactCard) -> None:
@@ -90,7 +94,8 @@ class SQLRegistryBase:
                 {self.table_name}"""
             )
 
-        if self.check_uid(uid=str(card.uid), registry_type=self.registry_type):
+        # new cards have no uid yet, so there is nothing to look up
+        if card.uid is not None and self.check_uid(uid=card.uid, registry_type=self.registry_type):
             raise ValueError(
                 """This Card has already been registered.
             If the card has been modified try updating the Card in the registry.
@@ -211,6 +216,45 @@ class SQLRegistryBase:
         if card.uid is None:
             card.uid = self._get_uid()
 
+    def _validate_and_version_card(
+        self,
+        card: ArtifactCard,
+        version_type: VersionType,
+        pre_tag: str,
+        build_tag: str,
+    ) -> None:
+        """Validates a card and sets its version and uid
+
+        Args:
+            card:
+                Card to register
+            version_type:
+                Version type for increment
+            pre_tag:
+                Pre-release tag
+            build_tag:
+                Build tag
+        """
+        self._validate_card_type(card=card)
+        self._set_card_version(card=card, version_type=version_type, pre_tag=pre_tag, build_tag=build_tag)
+        self._set_card_uid(card=card)
+
+    def _save_card_record(self, card: ArtifactCard) -> Dict[str, Any]:
+        """Saves a validated card's artifacts and returns the registry record to insert
+
+        Args:
+            card:
+                Card to register
+
+        Returns:
+            Registry record
+        """
+        save_card_artifacts(card=card)
+        registry_record: SaveRecord = registry_name_record_map[card.card_type]
+        record = registry_record.model_validate(card.create_registry_record())
+
+        return record.model_dump()
+
     def register_card(
         self,
         card: ArtifactCard,
@@ -232,15 +276,76 @@ class SQLRegistryBase:
                 Build tag. Defaults to "build"
         """
 
-        self._validate_card_type(card=card)
-        self._set_card_version(card=card, version_type=version_type, pre_tag=pre_tag, build_tag=build_tag)
-        self._set_card_uid(card=card)
+        self._validate_and_version_card(card=card, version_type=version_type, pre_tag=pre_tag, build_tag=build_tag)
+        self.add_and_commit(card=self._save_card_record(card=card))
 
-        save_card_artifacts(card=card)
-        registry_record: SaveRecord = registry_name_record_map[card.card_type]
-        record = registry_record.model_validate(card.create_registry_record())
+    def _validate_batch_names(self, cards: List[ArtifactCard]) -> None:
+        """Versions are resolved against the registry before any card is inserted, so a name can
+        only appear once per batch
+
+        Args:
+            cards:
+                Cards to register
+        """
+        repositories: Dict[str, str] = {}
+
+        for card in cards:
+            assert card.name is not None
+            assert card.repository is not None
+
+            if card.name in repositories:
+                if repositories[card.name] != card.repository:
+                    raise ValueError("""Model name already exists for a different repository. Try a different name.""")
+                raise ValueError(
+                    f"Cards registered together must have unique names. {card.name} appears more than once"
+                )
+
+            repositories[card.name] = card.repository
+
+    def register_cards(
+        self,
+        cards: List[ArtifactCard],
+        version_type: VersionType = VersionType.MINOR,
+        pre_tag: str = "rc",
+        build_tag: str = "build",
+    ) -> None:
+        """
+        Adds new records to registry with a single insert. Every card is validated and versioned
+        before any artifacts are saved.
 
-        self.add_and_commit(card=record.model_dump())
+        Args:
+            cards:
+                Cards to register. Each card must have a unique name
+            version_type:
+                Version type for increment. Options are "major", "minor" and "patch". Defaults to "minor"
+            pre_tag:
+                Pre-release tag. Defaults to "rc"
+            build_tag:
+                Build tag. Defaults to "build"
+        """
+
+        self._validate_batch_names(cards=cards)
+
+        supplied = [(card.uid, card.version) for card in cards]
+        try:
+            for card in cards:
+                self._validate_and_version_card(
+                    card=card,
+                    version_type=version_type,
+                    pre_tag=pre_tag,
+                    build_tag=build_tag,
+                )
+
+            records = [self._save_card_record(card=card) for card in cards]
+            if records:
+                self.add_and_commit_many(cards=records)
+
+        except Exception:
+            # nothing from the batch was inserted, so reset every card so the batch can be registered again
+            for card, (uid, version) in zip(cards, supplied):
+                card.uid = uid
+                card.version = version
+            raise
 
     def update_card(self, card: ArtifactCard) -> None:
         """
@@ -254,7 +359,8 @@ class SQLRegistryBase:
         record = self.list_cards(uid=card.uid, limit=1)
         assert bool(record), "Card does not exist in registry. Please use register card first"
         save_card_artifacts(card=card)
-        save_record: SaveRecord = registry_name_record_map[card.card_type](**card.create_registry_record())
+        registry_record: SaveRecord = registry_name_record_map[card.card_type]
+        save_record = registry_record.model_validate(card.create_registry_record())
 
         self.update_card_record(card=save_record.model_dump())
 
@@ -275,6 +381,12 @@ class SQLRegistryBase:
     def check_uid(self, uid: str, registry_type: RegistryType) -> bool:
         raise NotImplementedError
 
+    def get_project_id(self, project_name: str) -> Optional[int]:
+        raise NotImplementedError
+
+    def get_max_project_id(self) -> int:
+        raise NotImplementedError
+
     def _sort_by_version(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         versions = [record["version"] for record in records]
         sorted_versions = SemVerUtils.sort_semvers(versions)
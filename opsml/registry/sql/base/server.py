@@ -3,7 +3,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import textwrap
-from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, cast
 
 from opsml.cards import ArtifactCard, ModelCard
 from opsml.helpers.logging import ArtifactLogger
@@ -49,10 +49,6 @@ class ServerRegistry(SQLRegistryBase):
         """Registry type"""
         raise NotImplementedError
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        raise NotImplementedError
-
     @property
     def unique_repositories(self) -> Sequence[str]:
         """Returns a list of unique repositories"""
@@ -143,6 +139,11 @@ class ServerRegistry(SQLRegistryBase):
         self.engine.add_and_commit_card(table=self._table, card=card)
         return card, "registered"
 
+    def add_and_commit_many(self, cards: List[Dict[str, Any]]) -> None:
+        self.engine.add_and_commit_cards(table=self._table, cards=cards)
+        for card in cards:
+            logger.info("{}: {}, version:{} registered", self.table_name, card.get("name"), card.get("version"))
+
     @log_card_change
     def update_card_record(self, card: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
         self.engine.update_card_record(table=self._table, card=card)
@@ -238,10 +239,6 @@ class ServerDataCardRegistry(ServerRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.DATA
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.DATA.value
-
 
 class ServerModelCardRegistry(ServerRegistry):
     @property
@@ -290,22 +287,6 @@ class ServerModelCardRegistry(ServerRegistry):
             )
 
         else:
-            model_card = cast(ModelCard, card)
-
-            if model_card.to_onnx:
-                if not check_package_exists("onnx"):
-                    raise ModuleNotFoundError(
-                        """To convert a model to onnx, please install onnx via one of the extras
-                        (opsml[sklearn_onnx], opsml[tf_onnx], opsml[torch_onnx]) or set to_onnx to False.
-                        """
-                    )
-
-            if not self._has_datacard_uid(uid=model_card.datacard_uid):
-                raise ValueError("""ModelCard must be associated with a valid DataCard uid""")
-
-            if model_card.datacard_uid is not None:
-                self._validate_datacard_uid(uid=model_card.datacard_uid)
-
             super().register_card(
                 card=card,
                 version_type=version_type,
@@ -313,9 +294,35 @@ class ServerModelCardRegistry(ServerRegistry):
                 build_tag=build_tag,
             )
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.MODEL.value
+    def _validate_and_version_card(
+        self,
+        card: ArtifactCard,
+        version_type: VersionType,
+        pre_tag: str,
+        build_tag: str,
+    ) -> None:
+        model_card = cast(ModelCard, card)
+
+        if model_card.to_onnx:
+            if not check_package_exists("onnx"):
+                raise ModuleNotFoundError(
+                    """To convert a model to onnx, please install onnx via one of the extras
+                    (opsml[sklearn_onnx], opsml[tf_onnx], opsml[torch_onnx]) or set to_onnx to False.
+                    """
+                )
+
+        if not self._has_datacard_uid(uid=model_card.datacard_uid):
+            raise ValueError("""ModelCard must be associated with a valid DataCard uid""")
+
+        if model_card.datacard_uid is not None:
+            self._validate_datacard_uid(uid=model_card.datacard_uid)
+
+        super()._validate_and_version_card(
+            card=card,
+            version_type=version_type,
+            pre_tag=pre_tag,
+            build_tag=build_tag,
+        )
 
 
 class ServerRunCardRegistry(ServerRegistry):
@@ -323,20 +330,12 @@ class ServerRunCardRegistry(ServerRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.RUN
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.RUN.value
-
 
 class ServerPipelineCardRegistry(ServerRegistry):
     @property
     def registry_type(self) -> RegistryType:
         return RegistryType.PIPELINE
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.PIPELINE.value
-
     def delete_card(self, card: ArtifactCard) -> None:
         raise ValueError("PipelineCardRegistry does not support delete_card")
 
@@ -346,13 +345,25 @@ class ServerProjectCardRegistry(ServerRegistry):
     def registry_type(self) -> RegistryType:
         return RegistryType.PROJECT
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.PROJECT.value
-
     def delete_card(self, card: ArtifactCard) -> None:
         raise ValueError("ProjectCardRegistry does not support delete_card")
 
+    def get_project_id(self, project_name: str) -> Optional[int]:
+        """Returns the project_id for a given project name
+
+        Args:
+            project_name:
+                Name of the project
+
+        Returns:
+            project_id or None if the project does not exist
+        """
+        return self.engine.get_project_id(project_name=project_name, table=self._table)
+
+    def get_max_project_id(self) -> int:
+        """Returns the highest project_id in the registry or 0 if there are no projects"""
+        return self.engine.get_max_project_id(table=self._table)
+
 
 class ServerAuditCardRegistry(ServerRegistry):
     @property
@@ -362,6 +373,12 @@ class ServerAuditCardRegistry(ServerRegistry):
     def validate_uid(self, uid: str, registry_type: RegistryType) -> bool:
         return self.check_uid(uid=uid, registry_type=registry_type)
 
-    @staticmethod
-    def validate(registry_name: str) -> bool:
-        return registry_name.lower() == RegistryType.AUDIT.value
+
+SERVER_REGISTRIES: Dict[RegistryType, Type[ServerRegistry]] = {
+    RegistryType.DATA: ServerDataCardRegistry,
+    RegistryType.MODEL: ServerModelCardRegistry,
+    RegistryType.RUN: ServerRunCardRegistry,
+    RegistryType.PIPELINE: ServerPipelineCardRegistry,
+    RegistryType.PROJECT: ServerProjectCardRegistry,
+    RegistryType.AUDIT: ServerAuditCardRegistry,
+}
@@ -4,6 +4,7 @@
 import os
 import uuid
 from datetime import date
+from functools import lru_cache
 from typing import List, cast
 
 from sqlalchemy import BigInteger, Boolean, Column, Integer, String
@@ -18,6 +19,11 @@ logger = ArtifactLogger.get_logger()
 Base = declarative_base()
 
 
+def normalize_name(value: str) -> str:
+    """Normalizes a card name or repository as stored in the registry (lowercase, hyphens instead of underscores)"""
+    return value.lower().replace("_", "-")
+
+
 @declarative_mixin
 class BaseMixin:
     uid = Column("uid", String(64), primary_key=True, default=lambda: uuid.uuid4().hex)
@@ -32,11 +38,11 @@ class BaseMixin:
 
     @validates("repository")
     def lower_repository(self, key: str, repository: str) -> str:
-        return repository.lower().replace("_", "-")
+        return normalize_name(repository)
 
     @validates("name")
     def lower_name(self, key: str, name: str) -> str:
-        return name.lower().replace("_", "-")
+        return normalize_name(name)
 
 
 # this is only used for type hinting. All tables follow the same base structure
@@ -149,6 +155,7 @@ for schema in Base.__subclasses__():
 
 class SQLTableGetter:
     @staticmethod
+    @lru_cache
     def get_table(table_name: str) -> CardSQLTable:
         for table_schema in AVAILABLE_TABLES:
             if table_name == table_schema.__tablename__:
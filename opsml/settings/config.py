@@ -27,9 +27,17 @@ class OpsmlConfig(BaseSettings):
     opsml_username: Optional[str] = None
     opsml_password: Optional[str] = None
 
+    # Use HTTP/2 for API client requests (requires the h2 package)
+    opsml_http2: bool = False
+
     # The current RUN_ID to load when creating a new project
     opsml_run_id: Optional[str] = None
 
+    # Optional directory used to stage card artifacts before they are written to storage.
+    # Pointing this at tmpfs (e.g. /dev/shm) avoids a disk round-trip, but staged artifacts then
+    # count against memory, so only do so when they are known to fit
+    opsml_tmp_dir: Optional[str] = None
+
     @field_validator("opsml_storage_uri", mode="before")
     @classmethod
     def set_opsml_storage_uri(cls, opsml_storage_uri: str) -> str:
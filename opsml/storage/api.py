@@ -4,11 +4,13 @@
 
 import json as py_json
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Iterator, Optional, cast
 
 import httpx
 from tenacity import retry, stop_after_attempt
 
+from opsml.helpers.exceptions import RouteNotFoundError
+
 PATH_PREFIX = "opsml"
 
 
@@ -30,8 +32,11 @@ class ApiRoutes:
     DOWNLOAD_FILE = "files/download"
     DELETE_FILE = "files/delete"
     LIST_FILES = "files/list"
+    STREAM_LIST_FILES = "files/list/stream"
     UPLOAD_FILE = "files/upload"
     FILE_EXISTS = "files/exists"
+    PROJECT_ID = "projects/id"
+    MAX_PROJECT_ID = "projects/id/max"
 
 
 api_routes = ApiRoutes()
@@ -46,6 +51,7 @@ class ApiClient:
         password: Optional[str],
         token: Optional[str],
         path_prefix: str = PATH_PREFIX,
+        http2: bool = False,
     ):
         """Instantiates Api client for interacting with opsml server
 
@@ -54,9 +60,12 @@ class ApiClient:
                 Base url of server
             path_prefix:
                 Prefix for opsml server path
+            http2:
+                Whether to use HTTP/2. Requires the h2 package
 
         """
-        self.client = httpx.Client()
+        # single pooled client so keep-alive connections are reused across requests
+        self.client = httpx.Client(http2=http2)
 
         if token is not None:
             self.client.headers = httpx.Headers({"X-Prod-Token": token})
@@ -107,9 +116,34 @@ class ApiClient:
         if response.status_code == 200:
             return cast(Dict[str, Any], response.json())
 
+        if response.status_code in (404, 405):
+            raise RouteNotFoundError(f"Server does not support route: {route}")
+
         detail = response.json().get("detail")
         raise ValueError(f"""Failed to to make server call for get request Url: {route}, {detail}""")
 
+    def stream_get_request(self, route: str, params: Optional[Dict[str, str]] = None) -> Iterator[Any]:
+        """Streams a newline-delimited json response, yielding each decoded line as it arrives
+
+        Args:
+            route:
+                Route to request
+            params:
+                Optional query params
+        """
+        with self.client.stream(method="GET", url=f"{self._base_url}/{route}", params=params) as response:
+            if response.status_code in (404, 405):
+                raise RouteNotFoundError(f"Server does not support route: {route}")
+
+            if response.status_code != 200:
+                response.read()
+                detail = response.json().get("detail")
+                raise ValueError(f"""Failed to to make server call for get request Url: {route}, {detail}""")
+
+            for line in response.iter_lines():
+                if line:
+                    yield py_json.loads(line)
+
     @retry(reraise=True, stop=stop_after_attempt(3))
     def stream_post_request(
         self, route: str, files: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, Any]] = None
@@ -135,14 +169,10 @@ class ApiClient:
         )
 
     @retry(reraise=True, stop=stop_after_attempt(3))
-    def stream_download_file_request(
-        self, route: str, local_dir: Path, filename: str, read_dir: Path
-    ) -> Dict[str, Any]:
-        local_dir.mkdir(parents=True, exist_ok=True)  # for subdirs that may be in path
-        read_path = read_dir / filename
-        local_path = local_dir / filename
+    def stream_download_file_request(self, route: str, local_path: Path, read_path: Path) -> Dict[str, Any]:
+        """Streams a file from the server to local_path. The parent directory of local_path must exist"""
 
-        with open(local_path.as_posix(), "wb") as local_file:
+        with open(local_path, "wb") as local_file:
             with self.client.stream(
                 method="GET", url=f"{self._base_url}/{route}", params={"path": read_path.as_posix()}
             ) as response:
@@ -11,6 +11,8 @@ from typing import Any, Dict, Iterator, Optional, Union, cast
 from venv import logger
 
 import joblib
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pydantic import BaseModel
 
 from opsml.cards import (
@@ -41,6 +43,10 @@ table_name_card_map = {
     RegistryType.PROJECT.value: ProjectCard,
 }
 
+# interface classes resolved by name, filled as interfaces are loaded
+_data_interfaces: Dict[str, Any] = {}
+_model_interfaces: Dict[str, Any] = {}
+
 
 class CardLoadArgs(BaseModel):
     name: str
@@ -66,13 +72,22 @@ def _get_data_interface(interface_type: str) -> DataInterface:
         interface_type:
             Name of interface
     """
+    if interface_type in _data_interfaces:
+        return _data_interfaces[interface_type]
+
     interfaces = all_subclasses(DataInterface)
     interfaces.update(all_subclasses(Dataset))
 
-    return next(
+    interface = next(
         (cls for cls in interfaces if cls.name() == interface_type),  # type: ignore
-        DataInterface,  # type: ignore
+        None,
     )
+    if interface is None:
+        # not cached, the subclass may not be defined yet
+        return DataInterface  # type: ignore
+
+    _data_interfaces[interface_type] = interface
+    return interface
 
 
 def _get_model_interface(interface_type: str) -> ModelInterface:
@@ -83,10 +98,19 @@ def _get_model_interface(interface_type: str) -> ModelInterface:
             Name of interface
     """
 
-    return next(
+    if interface_type in _model_interfaces:
+        return _model_interfaces[interface_type]
+
+    interface = next(
         (cls for cls in all_subclasses(ModelInterface) if cls.name() == interface_type),  # type: ignore
-        ModelInterface,  # type: ignore[arg-type]
+        None,
     )
+    if interface is None:
+        # not cached, the subclass may not be defined yet
+        return ModelInterface  # type: ignore[return-value]
+
+    _model_interfaces[interface_type] = interface
+    return interface
 
 
 def get_interface(registry_type: RegistryType, interface_type: str) -> Union[ModelInterface, DataInterface]:
@@ -219,7 +243,7 @@ class CardLoader:
 
             loaded_card["interface"] = loaded_interface
 
-        return cast(ArtifactCard, table_name_card_map[self.registry_type](**loaded_card))
+        return cast(ArtifactCard, table_name_card_map[self.registry_type].model_validate(loaded_card))
 
     @staticmethod
     def validate(card_type: str) -> bool:
@@ -280,6 +304,15 @@ class DataCardLoader(CardLoader):
             return self._load_dataset_data(**kwargs)
         return self._load_interface_data()
 
+    def iter_batches(self, batch_size: int) -> Iterator[pa.RecordBatch]:
+        """Streams saved parquet data in record batches. The local copy is removed once iteration ends"""
+
+        if not isinstance(self.card.interface, DataInterface) or self.data_suffix != Suffix.PARQUET.value:
+            raise ValueError("Batch iteration is only supported for interfaces that save data as parquet")
+
+        with self._load_object(SaveName.DATA.value, self.data_suffix) as lpath:
+            yield from pq.ParquetFile(lpath, memory_map=True).iter_batches(batch_size=batch_size)
+
     def load_data_profile(self) -> None:
         """Saves a data profile"""
 
@@ -494,7 +527,7 @@ class ModelCardLoader(CardLoader):
             with load_path.open(encoding="utf-8") as json_file:
                 metadata = json.load(json_file)
 
-        return ModelMetadata(**metadata)
+        return ModelMetadata.model_validate(metadata)
 
     def load_onnx_model(self, **kwargs: Any) -> None:
         if self.card.interface.onnx_model is not None:
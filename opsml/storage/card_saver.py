@@ -20,6 +20,7 @@ from opsml.data import DataInterface, Dataset
 from opsml.helpers.logging import ArtifactLogger
 from opsml.model.interfaces.huggingface import HuggingFaceModel
 from opsml.model.metadata_creator import _TrainedModelMetadataCreator
+from opsml.settings.config import config
 from opsml.storage import client
 from opsml.types import CardType, ModelMetadata, SaveName, UriNames
 from opsml.types.extra import Suffix
@@ -175,7 +176,7 @@ class DataCardSaver(CardSaver):
         self.card.metadata.interface_type = self.card.interface.name()
         self.card.metadata.data_type = self.card.interface.data_type
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
             self._save_data()
@@ -334,7 +335,7 @@ class ModelCardSaver(CardSaver):
         self.card.metadata.interface_type = self.card.interface.__class__.__name__
         self.card.interface.modelcard_uid = str(self.card.uid)
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
 
@@ -365,7 +366,7 @@ class AuditCardSaver(CardSaver):
 
     def save_artifacts(self) -> None:
         """Save auditcard artifacts"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
             self._save_auditcard()
@@ -390,7 +391,7 @@ class RunCardSaver(CardSaver):
 
     def save_artifacts(self) -> None:
         """Saves a runcard's artifacts"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
             self._save_runcard()
@@ -414,7 +415,7 @@ class PipelineCardSaver(CardSaver):
 
     def save_artifacts(self) -> None:
         """Saves a pipelinecard's artifacts"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
             self._save_pipelinecard()
@@ -438,7 +439,7 @@ class ProjectCardSaver(CardSaver):
 
     def save_artifacts(self) -> None:
         """Saves a projectcard's artifacts"""
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        with tempfile.TemporaryDirectory(dir=config.opsml_tmp_dir) as tmp_dir:
             self.card_uris.lpath = Path(tmp_dir)
             self.card_uris.rpath = self.card.uri
             self._save_projectcard()
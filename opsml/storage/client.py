@@ -5,12 +5,15 @@
 
 
 import io
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import BinaryIO, Iterator, List, Optional, Protocol, cast
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Protocol, Set, cast
 
 from fsspec.implementations.local import LocalFileSystem
 
+from opsml.helpers.exceptions import RouteNotFoundError
 from opsml.helpers.logging import ArtifactLogger
 from opsml.settings.config import OpsmlConfig, config
 from opsml.storage.api import ApiClient, ApiRoutes
@@ -29,6 +32,8 @@ warnings.filterwarnings("ignore", message="Hint: Inferred schema contains intege
 
 logger = ArtifactLogger.get_logger()
 
+DOWNLOAD_WORKERS = 8  # concurrent file downloads per ApiStorageClient.get call
+
 
 class _FileSystemProtocol(Protocol):
     """
@@ -109,10 +114,10 @@ class StorageClientBase(StorageClientProtocol):
         self.client.get(rpath=abs_rpath, lpath=abs_lpath, recursive=recursive)
 
     def ls(self, path: Path) -> List[Path]:
-        return [Path(p) for p in self.client.ls(str(path))]
+        return list(map(Path, self.client.ls(str(path))))
 
     def find(self, path: Path) -> List[Path]:
-        return [Path(p) for p in self.client.find(str(path))]
+        return list(map(Path, self.client.find(str(path))))
 
     def open(self, path: Path, mode: str, encoding: Optional[str] = None) -> BinaryIO:
         return self.client.open(str(path), mode=mode, encoding=encoding)
@@ -206,58 +211,117 @@ class ApiStorageClient(StorageClientBase):
             username=settings.opsml_username,
             password=settings.opsml_password,
             token=settings.opsml_prod_token,
+            http2=settings.opsml_http2,
+        )
+
+        # disabled on first use if the server does not have the streaming list route
+        self._stream_listing = True
+
+    def _download_file(self, rpath: Path, lpath: Path) -> None:
+        self.api_client.stream_download_file_request(
+            route=ApiRoutes.DOWNLOAD_FILE,
+            local_path=lpath,
+            read_path=rpath,
         )
 
     def get(self, rpath: Path, lpath: Path, recursive: bool = True) -> None:
-        """Copies file(s) from remote path (rpath) to local path (lpath)"""
+        """Copies file(s) from remote path (rpath) to local path (lpath).
+
+        Files are downloaded concurrently so a multi-file artifact (e.g. a huggingface model
+        directory) takes roughly as long as its largest file rather than the sum of all files
+        """
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = []
+            created_dirs: Set[Path] = set()
 
-        for file in self.find(rpath):
-            _rpath = Path(file)
+            # downloads start as soon as the first path is streamed back
+            for _rpath in self.iterfind(rpath):
 
-            # for single files
-            if _rpath.name == lpath.name:
-                _lpath = lpath
+                # for single files
+                if _rpath.name == lpath.name:
+                    _lpath = lpath
 
-            # for files in nested dirs
-            else:
-                index = _rpath.parts.index(lpath.name)
-                _lpath = lpath.joinpath(*_rpath.parts[index + 1 :])
+                # for files in nested dirs
+                else:
+                    index = _rpath.parts.index(lpath.name)
+                    _lpath = lpath.joinpath(*_rpath.parts[index + 1 :])
 
-            self.api_client.stream_download_file_request(
-                route=ApiRoutes.DOWNLOAD_FILE,
-                local_dir=_lpath.parent,
-                read_dir=_rpath.parent,
-                filename=_rpath.name,
-            )
+                # create each local directory once rather than once per file
+                if _lpath.parent not in created_dirs:
+                    _lpath.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(_lpath.parent)
 
-    def find(self, path: Path) -> List[Path]:
+                futures.append(executor.submit(self._download_file, _rpath, _lpath))
+
+            # surface the first download error, if any
+            for future in as_completed(futures):
+                future.result()
+
+    def _list_files(self, path: Path) -> List[Path]:
+        """Lists files through the non-streaming route supported by all server versions"""
         response = self.api_client.get_request(
             route=ApiRoutes.LIST_FILES,
             params={"path": path.as_posix()},
         )
-
-        # storage clients always return a list
         files: List[str] = response["files"]
 
         return [Path(p) for p in files]
 
-    def put(self, lpath: Path, rpath: Path) -> None:
-        if not lpath.is_file():
-            for curr_lpath in lpath.rglob("*"):
-                if curr_lpath.is_file():
-                    curr_rpath = rpath / curr_lpath.relative_to(lpath)
-                    self.put(curr_lpath, curr_rpath)
-            return None
+    def iterfind(self, path: Path) -> Iterator[Path]:
+        """Lazily lists all files in a directory (recursive) as the server streams them back.
+
+        Falls back to the non-streaming route for servers that predate it
+        """
+        if self._stream_listing:
+            try:
+                for file_ in self.api_client.stream_get_request(
+                    route=ApiRoutes.STREAM_LIST_FILES,
+                    params={"path": path.as_posix()},
+                ):
+                    yield Path(file_)
+                return
+
+            except RouteNotFoundError:
+                # raised before any path is yielded
+                self._stream_listing = False
+
+        yield from self._list_files(path)
+
+    def find(self, path: Path) -> List[Path]:
+        # storage clients always return a list
+        return list(self.iterfind(path))
 
+    def _upload_file(self, file_: BinaryIO, filename: str, rpath: Path) -> None:
+        """Uploads an open file to remote path (rpath)"""
         response = self.api_client.stream_post_request(
             route=ApiRoutes.UPLOAD_FILE,
-            files={"file": lpath.open("rb")},
+            files={"file": (filename, file_, "application/octet-stream")},
             headers={"write_path": rpath.as_posix()},
         )
         storage_uri: Optional[str] = response.get("storage_uri")
 
         if storage_uri is None:
             raise ValueError("Failed to write file to storage")
+
+    def put(self, lpath: Path, rpath: Path) -> None:
+        if lpath.is_file():
+            with lpath.open("rb") as file_:
+                self._upload_file(file_, lpath.name, rpath)
+            return None
+
+        if not hasattr(os, "fwalk"):  # fwalk is not available on windows
+            for curr_lpath in lpath.rglob("*"):
+                if curr_lpath.is_file():
+                    self.put(curr_lpath, rpath / curr_lpath.relative_to(lpath))
+            return None
+
+        # fwalk keeps an open fd per directory so files are opened relative to it
+        # instead of re-resolving the full path for every file
+        for dirpath, _, filenames, dirfd in os.fwalk(lpath):
+            curr_rpath = rpath / Path(dirpath).relative_to(lpath)
+            for filename in filenames:
+                with os.fdopen(os.open(filename, os.O_RDONLY, dir_fd=dirfd), "rb") as file_:
+                    self._upload_file(file_, filename, curr_rpath / filename)
         return None
 
     def copy(self, src: Path, dest: Path, recursive: bool = True) -> None:
@@ -302,24 +366,43 @@ def _get_gcs_settings(storage_uri: str) -> GcsStorageClientSettings:
     )
 
 
-def get_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
-    if not cfg.is_tracking_local:
-        return ApiStorageClient(
-            ApiStorageClientSettings(
-                storage_uri=cfg.opsml_storage_uri,
-                opsml_tracking_uri=cfg.opsml_tracking_uri,
-                opsml_username=cfg.opsml_username,
-                opsml_password=cfg.opsml_password,
-                opsml_prod_token=cfg.opsml_prod_token,
-            )
+def _get_api_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
+    return ApiStorageClient(
+        ApiStorageClientSettings(
+            storage_uri=cfg.opsml_storage_uri,
+            opsml_tracking_uri=cfg.opsml_tracking_uri,
+            opsml_username=cfg.opsml_username,
+            opsml_password=cfg.opsml_password,
+            opsml_prod_token=cfg.opsml_prod_token,
+            opsml_http2=cfg.opsml_http2,
         )
-    if cfg.storage_system == StorageSystem.GCS:
-        return GCSFSStorageClient(_get_gcs_settings(storage_uri=cfg.opsml_storage_uri))
-    if cfg.storage_system == StorageSystem.S3:
-        return S3StorageClient(S3StorageClientSettings(storage_uri=cfg.opsml_storage_uri))
+    )
+
+
+def _get_gcs_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
+    return GCSFSStorageClient(_get_gcs_settings(storage_uri=cfg.opsml_storage_uri))
+
+
+def _get_s3_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
+    return S3StorageClient(S3StorageClientSettings(storage_uri=cfg.opsml_storage_uri))
+
+
+def _get_local_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
     return LocalStorageClient(StorageClientSettings(storage_uri=cfg.opsml_storage_uri))
 
 
+_STORAGE_CLIENT_GETTERS: Dict[StorageSystem, Callable[[OpsmlConfig], StorageClientBase]] = {
+    StorageSystem.API: _get_api_storage_client,
+    StorageSystem.GCS: _get_gcs_storage_client,
+    StorageSystem.S3: _get_s3_storage_client,
+    StorageSystem.LOCAL: _get_local_storage_client,
+}
+
+
+def get_storage_client(cfg: OpsmlConfig) -> StorageClientBase:
+    return _STORAGE_CLIENT_GETTERS[cfg.storage_system](cfg)
+
+
 # The global storage client. When importing from this module, be sure to import
 # the *module* rather than storage_client itself to simplify mocking. Tests will
 # mock the global storage client.
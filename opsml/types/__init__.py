@@ -31,7 +31,10 @@ from opsml.types.huggingface import (
     HuggingFaceTask,
 )
 from opsml.types.model import (
+    AVAILABLE_MODEL_TYPE_VALUES,
     AVAILABLE_MODEL_TYPES,
+    CLASS_NAME_TO_MODEL_TYPE,
+    FEATURE_VALIDATOR,
     LIGHTGBM_SUPPORTED_MODEL_TYPES,
     SKLEARN_SUPPORTED_MODEL_TYPES,
     UPDATE_REGISTRY_MODELS,
@@ -56,6 +59,7 @@ from opsml.types.model import (
     TrainedModelType,
     ValidModelInput,
     ValidSavedSample,
+    resolve_model_type,
 )
 from opsml.types.sql import RegistryTableNames
 from opsml.types.storage import (
@@ -98,7 +102,10 @@ __all__ = [
     "GENERATION_TYPES",
     "HuggingFaceORTModel",
     "HuggingFaceTask",
+    "AVAILABLE_MODEL_TYPE_VALUES",
     "AVAILABLE_MODEL_TYPES",
+    "CLASS_NAME_TO_MODEL_TYPE",
+    "FEATURE_VALIDATOR",
     "LIGHTGBM_SUPPORTED_MODEL_TYPES",
     "SKLEARN_SUPPORTED_MODEL_TYPES",
     "UPDATE_REGISTRY_MODELS",
@@ -123,6 +130,7 @@ __all__ = [
     "TrainedModelType",
     "ValidModelInput",
     "ValidSavedSample",
+    "resolve_model_type",
     "ApiStorageClientSettings",
     "FilePath",
     "GcsStorageClientSettings",
@@ -9,13 +9,11 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Protocol, Tuple, Union
 
 import numpy as np
-import pandas as pd
-import polars as pl
-import pyarrow as pa
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from opsml.helpers.logging import ArtifactLogger
@@ -23,11 +21,17 @@ from opsml.types.extra import Description
 from opsml.types.huggingface import HuggingFaceORTModel
 from opsml.version import __version__
 
+# dataframe libraries are only needed for the type aliases below and are slow to import
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
 logger = ArtifactLogger.get_logger()
 
 # Dict[str, Any] is used because an input value can be a numpy, torch, or tensorflow tensor
-ValidModelInput = Union[pd.DataFrame, np.ndarray, Dict[str, Any], pl.DataFrame, str]  # type: ignore
-ValidSavedSample = Union[pa.Table, np.ndarray, Dict[str, np.ndarray]]  # type: ignore
+ValidModelInput = Union["pd.DataFrame", np.ndarray, Dict[str, Any], "pl.DataFrame", str]  # type: ignore
+ValidSavedSample = Union["pa.Table", np.ndarray, Dict[str, np.ndarray]]  # type: ignore
 
 try:
     import onnxruntime as rt
@@ -72,28 +76,35 @@ class TrainedModelType(str, Enum):
     CATBOOST = "CatBoost"
 
 
-SKLEARN_SUPPORTED_MODEL_TYPES = [
-    TrainedModelType.SKLEARN_ESTIMATOR,
-    TrainedModelType.STACKING_REGRESSOR,
-    TrainedModelType.STACKING_CLASSIFIER,
-    TrainedModelType.SKLEARN_PIPELINE,
-    TrainedModelType.LGBM_REGRESSOR,
-    TrainedModelType.LGBM_CLASSIFIER,
-    TrainedModelType.XGB_REGRESSOR,
-    TrainedModelType.CALIBRATED_CLASSIFIER,
-]
-
-LIGHTGBM_SUPPORTED_MODEL_TYPES = [
-    TrainedModelType.LGBM_BOOSTER,
-]
-
-UPDATE_REGISTRY_MODELS = [
-    TrainedModelType.LGBM_CLASSIFIER,
-    TrainedModelType.LGBM_REGRESSOR,
-    TrainedModelType.XGB_REGRESSOR,
-]
+SKLEARN_SUPPORTED_MODEL_TYPES = frozenset(
+    {
+        TrainedModelType.SKLEARN_ESTIMATOR,
+        TrainedModelType.STACKING_REGRESSOR,
+        TrainedModelType.STACKING_CLASSIFIER,
+        TrainedModelType.SKLEARN_PIPELINE,
+        TrainedModelType.LGBM_REGRESSOR,
+        TrainedModelType.LGBM_CLASSIFIER,
+        TrainedModelType.XGB_REGRESSOR,
+        TrainedModelType.CALIBRATED_CLASSIFIER,
+    }
+)
+
+LIGHTGBM_SUPPORTED_MODEL_TYPES = frozenset(
+    {
+        TrainedModelType.LGBM_BOOSTER,
+    }
+)
+
+UPDATE_REGISTRY_MODELS = frozenset(
+    {
+        TrainedModelType.LGBM_CLASSIFIER,
+        TrainedModelType.LGBM_REGRESSOR,
+        TrainedModelType.XGB_REGRESSOR,
+    }
+)
 
 AVAILABLE_MODEL_TYPES = list(TrainedModelType)
+AVAILABLE_MODEL_TYPE_VALUES = frozenset(AVAILABLE_MODEL_TYPES)
 
 
 class HuggingFaceModuleType(str, Enum):
@@ -121,6 +132,10 @@ class DataSchema(BaseModel):
     model_config = ConfigDict(frozen=False)
 
 
+# bound once so per-column feature construction skips the class attribute lookup
+FEATURE_VALIDATOR = Feature.__pydantic_validator__.validate_python
+
+
 class OnnxModel(BaseModel):
     onnx_version: str = Field(..., description="Version of onnx model used to create proto")
     sess: Union[OnnxInferenceSession, ORTModel, Pipeline] = Field(default=None, description="Onnx model session")  # type: ignore
@@ -196,6 +211,18 @@ class TorchOnnxArgs(BaseModel):
     options: Optional[Dict[str, Any]] = None
 
 
+@lru_cache(maxsize=1)
+def _optimum_config_types() -> Tuple[type, ...]:
+    """Imports optimum config classes on first use. Optimum is heavy to import and optional"""
+    from optimum.onnxruntime import (
+        AutoQuantizationConfig,
+        ORTConfig,
+        QuantizationConfig,
+    )
+
+    return (AutoQuantizationConfig, ORTConfig, QuantizationConfig)
+
+
 class HuggingFaceOnnxArgs(BaseModel):
     """Optional Args to use with a huggingface model
 
@@ -229,20 +256,7 @@ class HuggingFaceOnnxArgs(BaseModel):
         if config is None:
             return config
 
-        from optimum.onnxruntime import (
-            AutoQuantizationConfig,
-            ORTConfig,
-            QuantizationConfig,
-        )
-
-        assert isinstance(
-            config,
-            (
-                AutoQuantizationConfig,
-                ORTConfig,
-                QuantizationConfig,
-            ),
-        ), "config must be a valid optimum config"
+        assert isinstance(config, _optimum_config_types()), "config must be a valid optimum config"
 
         return config
 
@@ -415,14 +429,27 @@ class ModelProto(Protocol):
         return Graph()
 
 
+CLASS_NAME_TO_MODEL_TYPE = {
+    "Pipeline": TrainedModelType.SKLEARN_PIPELINE.value,
+    "CalibratedClassifierCV": TrainedModelType.CALIBRATED_CLASSIFIER.value,
+    "StackingRegressor": TrainedModelType.STACKING_ESTIMATOR.value,
+    "StackingClassifier": TrainedModelType.STACKING_ESTIMATOR.value,
+    "LGBMRegressor": TrainedModelType.LGBM_REGRESSOR.value,
+    "LGBMClassifier": TrainedModelType.LGBM_CLASSIFIER.value,
+    "XGBRegressor": TrainedModelType.XGB_REGRESSOR.value,
+    "XGBClassifier": TrainedModelType.XGB_CLASSIFIER.value,
+    "Booster": TrainedModelType.LGBM_BOOSTER.value,
+}
+
+
 class ModelType:
     @staticmethod
     def get_type() -> str:
         raise NotImplementedError
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        raise NotImplementedError
+    @classmethod
+    def validate(cls, model_class_name: str) -> bool:
+        return CLASS_NAME_TO_MODEL_TYPE.get(model_class_name) == cls.get_type()
 
 
 class SklearnPipeline(ModelType):
@@ -430,79 +457,61 @@ class SklearnPipeline(ModelType):
     def get_type() -> str:
         return TrainedModelType.SKLEARN_PIPELINE.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "Pipeline"
-
 
 class SklearnCalibratedClassifier(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.CALIBRATED_CLASSIFIER.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "CalibratedClassifierCV"
-
 
 class SklearnStackingEstimator(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.STACKING_ESTIMATOR.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name in ["StackingRegressor", "StackingClassifier"]
-
 
 class LightGBMRegressor(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.LGBM_REGRESSOR.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "LGBMRegressor"
-
 
 class LightGBMClassifier(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.LGBM_CLASSIFIER.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "LGBMClassifier"
-
 
 class XGBRegressor(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.XGB_REGRESSOR.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "XGBRegressor"
-
 
 class XGBClassifier(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.XGB_CLASSIFIER.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "XGBClassifier"
-
 
 class LightGBMBooster(ModelType):
     @staticmethod
     def get_type() -> str:
         return TrainedModelType.LGBM_BOOSTER.value
 
-    @staticmethod
-    def validate(model_class_name: str) -> bool:
-        return model_class_name == "Booster"
+
+def resolve_model_type(model_class_name: str) -> Optional[str]:
+    """Resolves an estimator class name to its model type in a single lookup
+    rather than walking the ModelType subclasses
+
+    Args:
+        model_class_name:
+            Name of the estimator class
+
+    Returns:
+        Model type or None if the class name is not supported
+    """
+    return CLASS_NAME_TO_MODEL_TYPE.get(model_class_name)
 
 
 class ModelCard(Protocol):
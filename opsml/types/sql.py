@@ -17,17 +17,13 @@ class RegistryTableNames(str, Enum):
 
     @staticmethod
     def from_str(name: str) -> "RegistryTableNames":
-        l_name = name.strip().lower()
-        if l_name == "data":
-            return RegistryTableNames.DATA
-        if l_name == "model":
-            return RegistryTableNames.MODEL
-        if l_name == "run":
-            return RegistryTableNames.RUN
-        if l_name == "pipeline":
-            return RegistryTableNames.PIPELINE
-        if l_name == "project":
-            return RegistryTableNames.PROJECT
-        if l_name == "audit":
-            return RegistryTableNames.AUDIT
-        raise NotImplementedError()
+        table_name = _REGISTRY_NAME_LOOKUP.get(name.strip().lower())
+        if table_name is None:
+            raise NotImplementedError()
+        return table_name
+
+
+# base is not a user-facing registry, so it is not resolvable by name
+_REGISTRY_NAME_LOOKUP = {
+    member.name.lower(): member for member in RegistryTableNames if member is not RegistryTableNames.BASE
+}
@@ -22,6 +22,9 @@ class StorageSystem(Enum):
 
 
 class StorageClientSettings(BaseModel):
+    # settings are built once per storage client and never mutated
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     storage_system: StorageSystem = StorageSystem.LOCAL
     storage_uri: str = os.getcwd()
 
@@ -37,13 +40,14 @@ class S3StorageClientSettings(StorageClientSettings):
 
 
 class ApiStorageClientSettings(StorageClientSettings):
-    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=False)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     storage_system: StorageSystem = StorageSystem.API
     opsml_tracking_uri: str
     opsml_username: Optional[str]
     opsml_password: Optional[str]
     opsml_prod_token: Optional[str]
+    opsml_http2: bool = False
 
 
 StorageSettings = Union[
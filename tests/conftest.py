@@ -252,7 +252,7 @@ def gcs_storage_client(gcs_test_bucket: Path) -> client.GCSFSStorageClient:
 
 
 def mock_registries(monkeypatch: pytest.MonkeyPatch, test_client: TestClient) -> CardRegistries:
-    def callable_api():
+    def callable_api(*args, **kwargs):
         return test_client
 
     with patch("httpx.Client", callable_api):
@@ -1204,7 +1204,7 @@ def populate_run(
 ) -> None:
     model, data = sklearn_pipeline
 
-    def callable_api():
+    def callable_api(*args, **kwargs):
         return test_app
 
     with patch("httpx.Client", callable_api):
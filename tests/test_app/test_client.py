@@ -2,6 +2,8 @@ import re
 import shutil
 import sys
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Tuple, cast
 from unittest.mock import MagicMock, patch
@@ -18,16 +20,18 @@ from opsml.cards import (
     DataCardMetadata,
     ModelCard,
     PipelineCard,
+    ProjectCard,
     RunCard,
 )
 from opsml.data import NumpyData, PandasData, TorchData
 from opsml.model import HuggingFaceModel, SklearnModel
 from opsml.projects.active_run import ActiveRun
 from opsml.registry import CardRegistries, CardRegistry
+from opsml.registry.sql.base import client as registry_client
 from opsml.settings.config import config
 from opsml.storage import client
 from opsml.storage.api import ApiRoutes
-from opsml.types import SaveName
+from opsml.types import RegistryType, SaveName
 from opsml.types.extra import Suffix
 from tests.conftest import TODAY_YMD
 
@@ -310,6 +314,56 @@ def test_pipeline_registry(api_registries: CardRegistry):
     assert bool(values["datacard_uids"])
 
 
+def test_project_id(api_registries: CardRegistries):
+    registry = api_registries.project._registry
+    assert registry.get_project_id("opsml-project") is None
+    assert registry.get_max_project_id() == 0
+
+    project_card = ProjectCard(
+        name="opsml-project",
+        repository="mlops",
+        contact="mlops.com",
+        project_id=1,
+    )
+    api_registries.project.register_card(card=project_card)
+
+    assert registry.get_project_id("opsml-project") == 1
+    assert registry.get_max_project_id() == 1
+
+
+def test_register_cards_client_mode(api_registries: CardRegistries, numpy_data: NumpyData) -> None:
+    card = DataCard(interface=numpy_data, name="client_batch", repository="mlops", contact="mlops.com")
+
+    # the server api registers one card per request, so batches are rejected instead of partially registered
+    with pytest.raises(ValueError, match="client mode"):
+        api_registries.data.register_cards(cards=[card])
+
+    assert card.uid is None
+    assert not api_registries.data.list_cards(name="client_batch")
+
+
+def test_project_id_old_server_fallback(api_registries: CardRegistries) -> None:
+    registry = api_registries.project._registry
+
+    # an older server without the project id routes returns 404, so lookups fall back to listing cards
+    with patch.object(ApiRoutes, "PROJECT_ID", "projects/id/missing"), patch.object(
+        ApiRoutes, "MAX_PROJECT_ID", "projects/id/max/missing"
+    ):
+        assert registry.get_project_id("opsml-fallback-project") is None
+        max_project_id = registry.get_max_project_id()
+
+        project_card = ProjectCard(
+            name="opsml-fallback-project",
+            repository="mlops",
+            contact="mlops.com",
+            project_id=max_project_id + 1,
+        )
+        api_registries.project.register_card(card=project_card)
+
+        assert registry.get_project_id("opsml-fallback-project") == max_project_id + 1
+        assert registry.get_max_project_id() == max_project_id + 1
+
+
 def test_metadata_download_and_registration(
     test_app: TestClient,
     populate_model_data_for_route: Tuple[ModelCard, DataCard, AuditCard],
@@ -794,3 +848,78 @@ def test_register_vit(
 
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.TRAINED_MODEL.value).with_suffix(model.model_suffix))
     assert api_storage_client.exists(Path(modelcard.uri, SaveName.FEATURE_EXTRACTOR.value).with_suffix(""))
+
+
+def test_list_files_old_server_fallback(
+    api_registries: CardRegistries,
+    api_storage_client: client.StorageClient,
+    numpy_data: NumpyData,
+) -> None:
+    data_card = DataCard(
+        interface=numpy_data,
+        name="list_fallback",
+        repository="mlops",
+        contact="mlops.com",
+    )
+    api_registries.data.register_card(card=data_card)
+
+    streamed = api_storage_client.find(Path(data_card.uri))
+    assert streamed
+
+    # an older server without the streaming route returns 404, so listing falls back to files/list
+    with patch.object(ApiRoutes, "STREAM_LIST_FILES", "files/list/missing"):
+        assert api_storage_client.find(Path(data_card.uri)) == streamed
+        assert api_storage_client._stream_listing is False
+
+    api_storage_client._stream_listing = True
+
+
+def test_client_known_uid_cache(
+    api_registries: CardRegistries,
+    numpy_data: NumpyData,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    registry = api_registries.data._registry
+    data_card = DataCard(
+        interface=numpy_data,
+        name="uid_cache",
+        repository="mlops",
+        contact="mlops.com",
+    )
+    api_registries.data.register_card(card=data_card)
+
+    # registered uids are cached per server
+    key = registry._uid_key(uid=data_card.uid, registry_type=RegistryType.DATA)
+    assert key == (registry._session.base_url, RegistryType.DATA.value, data_card.uid)
+    assert key in registry_client._KNOWN_UIDS
+
+    # a cached uid is confirmed without a server call
+    with patch.object(registry._session, "post_request", side_effect=AssertionError):
+        assert registry.check_uid(uid=data_card.uid, registry_type=RegistryType.DATA)
+
+    # deleting forgets the uid
+    api_registries.data.delete_card(card=data_card)
+    assert key not in registry_client._KNOWN_UIDS
+    assert not registry.check_uid(uid=data_card.uid, registry_type=RegistryType.DATA)
+
+    # a full cache evicts its oldest entry rather than everything
+    monkeypatch.setattr(registry_client, "_KNOWN_UIDS", OrderedDict())
+    monkeypatch.setattr(registry_client, "_KNOWN_UID_MAXSIZE", 2)
+    for uid in ("a", "b", "c"):
+        registry_client._remember_uid(("http://testserver", RegistryType.DATA.value, uid))
+
+    assert [uid for _, _, uid in registry_client._KNOWN_UIDS] == ["b", "c"]
+
+    # concurrent checks and evictions do not race on the shared cache
+    def remember_and_check(offset: int) -> None:
+        for idx in range(500):
+            key = ("http://testserver", RegistryType.DATA.value, str(offset + idx))
+            registry_client._remember_uid(key)
+            registry_client._is_known_uid(key)
+            registry_client._forget_uid(key)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        for future in [executor.submit(remember_and_check, offset * 1000) for offset in range(4)]:
+            future.result()
+
+    assert len(registry_client._KNOWN_UIDS) <= 2
@@ -3,6 +3,7 @@ import sys
 import uuid
 from pathlib import Path
 from typing import Tuple
+from unittest.mock import patch
 
 import joblib
 import polars as pl
@@ -508,6 +509,122 @@ def test_load_data_card(pandas_data: PandasData, db_registries: CardRegistries):
     assert record["version"] == "1.2.0"
 
 
+def test_datacard_iter_batches(pandas_data: PandasData, db_registries: CardRegistries):
+    registry = db_registries.data
+
+    data_card = DataCard(
+        interface=pandas_data,
+        name="test_df",
+        repository="mlops",
+        contact="mlops.com",
+    )
+    registry.register_card(card=data_card)
+
+    loaded_card: DataCard = registry.load_card(uid=data_card.uid)
+    batches = list(loaded_card.iter_batches(batch_size=3))
+
+    assert sum(batch.num_rows for batch in batches) == len(pandas_data.data)
+    assert max(batch.num_rows for batch in batches) <= 3
+    assert batches[0].schema.names == list(pandas_data.data.columns)
+    assert loaded_card.interface.data is None
+
+
+def test_register_cards(pandas_data: PandasData, db_registries: CardRegistries):
+    registry = db_registries.data
+
+    cards = [
+        DataCard(
+            interface=pandas_data,
+            name=f"test_batch_{idx}",
+            repository="mlops",
+            contact="mlops.com",
+        )
+        for idx in range(3)
+    ]
+    registry.register_cards(cards=cards)
+
+    for card in cards:
+        assert card.version == "1.0.0"
+        record = registry.list_cards(uid=card.uid)[0]
+        assert record["name"] == card.name
+
+    # cards sharing a name cannot be versioned in one batch
+    with pytest.raises(ValueError):
+        registry.register_cards(
+            cards=[
+                DataCard(interface=pandas_data, name="test_batch_0", repository="mlops", contact="mlops.com")
+                for _ in range(2)
+            ]
+        )
+
+    # a name cannot be split across repositories within a batch either
+    with pytest.raises(ValueError, match="different repository"):
+        registry.register_cards(
+            cards=[
+                DataCard(interface=pandas_data, name="test_batch_repo", repository=repository, contact="mlops.com")
+                for repository in ("mlops", "other")
+            ]
+        )
+
+    # or across the batch and the registry, and nothing in the batch is saved when one card fails
+    cards = [
+        DataCard(interface=pandas_data, name="test_batch_new", repository="mlops", contact="mlops.com"),
+        DataCard(interface=pandas_data, name="test_batch_0", repository="other", contact="mlops.com"),
+    ]
+    with pytest.raises(ValueError, match="different repository"):
+        registry.register_cards(cards=cards)
+
+    assert all(card.uid is None and card.version is None for card in cards)
+    assert not registry.list_cards(name="test_batch_new")
+    assert not registry.list_cards(name="test_batch_repo")
+
+    # a failed insert also resets the batch, so retrying registers every card
+    cards = [
+        DataCard(interface=pandas_data, name=f"test_batch_retry_{idx}", repository="mlops", contact="mlops.com")
+        for idx in range(2)
+    ]
+    with patch.object(registry._registry, "add_and_commit_many", side_effect=RuntimeError("insert failed")):
+        with pytest.raises(RuntimeError):
+            registry.register_cards(cards=cards)
+
+    assert all(card.uid is None and card.version is None for card in cards)
+
+    registry.register_cards(cards=cards)
+    for card in cards:
+        assert registry.list_cards(uid=card.uid)[0]["version"] == "1.0.0"
+
+
+def test_mixed_case_name_normalized(pandas_data: PandasData, db_registries: CardRegistries):
+    registry = db_registries.data
+
+    # assignment is not validated, so the name only gets normalized when the record is written
+    card = DataCard(interface=pandas_data, name="test_mixed", repository="mlops", contact="mlops.com")
+    card.name = "Mixed_Case"
+    card.repository = "Mixed_Repo"
+    registry.register_card(card=card)
+
+    record = registry.list_cards(uid=card.uid)[0]
+    assert record["name"] == "mixed-case"
+    assert record["repository"] == "mixed-repo"
+
+    card.name = "Mixed_Case_Updated"
+    registry.update_card(card=card)
+
+    record = registry.list_cards(uid=card.uid)[0]
+    assert record["name"] == "mixed-case-updated"
+
+    batch = [
+        DataCard(interface=pandas_data, name=f"test_mixed_{idx}", repository="mlops", contact="mlops.com")
+        for idx in range(2)
+    ]
+    for idx, batch_card in enumerate(batch):
+        batch_card.name = f"Mixed_Batch_{idx}"
+    registry.register_cards(cards=batch)
+
+    for idx, batch_card in enumerate(batch):
+        assert registry.list_cards(uid=batch_card.uid)[0]["name"] == f"mixed-batch-{idx}"
+
+
 def test_datacard_failure(pandas_data: PandasData, db_registries: CardRegistries):
     data_name = "test_df"
     repository = "mlops"
@@ -37,3 +37,10 @@ def test_base_splitter():
     splitter = DataSplitterBase(split=split, dependent_vars=[])
     with pytest.raises(ValueError):
         splitter.indices
+
+
+def test_split_indices_from_numpy():
+    split = DataSplit(label="train", indices=np.array([3, 1, 2]))
+
+    assert split.indices == [3, 1, 2]
+    assert all(type(idx) is int for idx in split.indices)